@@ -0,0 +1,38 @@
+"""Shared JSON codec, selected once at import time.
+
+orjson (already a nicegui dependency) provides the C-level encode/decode;
+stdlib json is the fallback. Both the SQLAlchemy engine codec (app.database)
+and response encoding (app.models) call these module-level singletons, so the
+fast path is bound once at import instead of being re-chosen per call.
+"""
+
+import dataclasses
+from typing import Any
+
+try:
+    import orjson
+
+    def json_encode(payload: Any) -> bytes:
+        """Encode a payload (dataclasses included) to JSON bytes."""
+        return orjson.dumps(payload, default=str)
+
+    json_decode = orjson.loads
+except ImportError:  # pragma: no cover - orjson ships as a nicegui dependency
+    import json
+
+    def json_encode(payload: Any) -> bytes:
+        """Encode a payload (dataclasses included) to JSON bytes."""
+
+        def _default(obj: Any) -> Any:
+            if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+                return dataclasses.asdict(obj)
+            return str(obj)
+
+        return json.dumps(payload, default=_default).encode()
+
+    json_decode = json.loads
+
+
+def json_encode_str(payload: Any) -> str:
+    """Encode to text for consumers that need str, e.g. SQL JSON binds."""
+    return json_encode(payload).decode()
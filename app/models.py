@@ -1,9 +1,52 @@
+import sys
+from dataclasses import dataclass
 from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlalchemy import ARRAY, Index, Integer, Numeric, SmallInteger, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from enum import Enum
 from decimal import Decimal
 
+from app.codec import json_encode
+
+# Serialize response dataclasses (or lists of them) straight to JSON bytes
+# through the shared module-level codec.
+encode_response = json_encode
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern low-cardinality strings that repeat across response rows.
+
+    Currency codes, game/website names, and bypass method labels take a
+    handful of distinct values, so interning makes every row in a large
+    response share one object per value instead of allocating a copy each.
+    """
+    return None if value is None else sys.intern(value)
+
+
+class FastDecimal(TypeDecorator):
+    """NUMERIC column that loads as float instead of decimal.Decimal.
+
+    Writes still accept Decimal so rounding stays exact on the way in; reads
+    skip the per-row Decimal allocation since the API serializes these fields
+    as plain JSON numbers anyway.
+    """
+
+    impl = Numeric
+    cache_ok = True
+
+    def __init__(self, precision: Optional[int] = None, scale: Optional[int] = None):
+        super().__init__(precision, scale)
+        # stored under the constructor-argument names so cache_ok picks the
+        # precision/scale up into the statement cache key
+        self.precision = precision
+        self.scale = scale
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[float]:
+        return None if value is None else float(value)
+
 
 class ScrapeStatus(str, Enum):
     PENDING = "pending"
@@ -23,6 +66,66 @@ class AntiScrapingMeasure(str, Enum):
     OTHER = "other"
 
 
+# JSON storage type: binary jsonb on Postgres (no reparse on access, GIN
+# indexable), plain JSON elsewhere. The engine-level orjson codec applies to
+# both variants.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+# Storage codes for enum columns. The codes are part of the on-disk format:
+# append new members with new codes, never renumber existing ones.
+SCRAPE_STATUS_CODES: Dict[ScrapeStatus, int] = {
+    ScrapeStatus.PENDING: 0,
+    ScrapeStatus.IN_PROGRESS: 1,
+    ScrapeStatus.SUCCESS: 2,
+    ScrapeStatus.FAILED: 3,
+    ScrapeStatus.BLOCKED: 4,
+}
+
+ANTI_SCRAPING_CODES: Dict[AntiScrapingMeasure, int] = {
+    AntiScrapingMeasure.NONE: 0,
+    AntiScrapingMeasure.CLOUDFLARE: 1,
+    AntiScrapingMeasure.CAPTCHA: 2,
+    AntiScrapingMeasure.RATE_LIMIT: 3,
+    AntiScrapingMeasure.USER_AGENT_BLOCK: 4,
+    AntiScrapingMeasure.IP_BLOCK: 5,
+    AntiScrapingMeasure.OTHER: 6,
+}
+
+_ENUM_CODES: Dict[type, Dict[Any, int]] = {
+    ScrapeStatus: SCRAPE_STATUS_CODES,
+    AntiScrapingMeasure: ANTI_SCRAPING_CODES,
+}
+
+
+class EnumInt(TypeDecorator):
+    """Store a str-valued Enum as SMALLINT using a fixed code table.
+
+    Skips the per-value string validation of a VARCHAR/sa.Enum column and
+    keeps the column two bytes wide instead of a label string per row.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type):
+        super().__init__()
+        # stored under the constructor-argument name so cache_ok puts the
+        # enum class into the statement cache key
+        self.enum_cls = enum_cls
+        self._to_code = _ENUM_CODES[enum_cls]
+        self._from_code = {code: member for member, code in self._to_code.items()}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        member = value if isinstance(value, self.enum_cls) else self.enum_cls(value)
+        return self._to_code[member]
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[Any]:
+        return None if value is None else self._from_code[value]
+
+
 # Persistent models (stored in database)
 class LotteryWebsite(SQLModel, table=True):
     """Stores information about lottery websites to scrape"""
@@ -36,16 +139,20 @@ class LotteryWebsite(SQLModel, table=True):
     is_active: bool = Field(default=True, description="Whether to scrape this website")
     scrape_interval_minutes: int = Field(default=60, description="How often to scrape in minutes")
     last_scraped_at: Optional[datetime] = Field(default=None, description="Last successful scrape timestamp")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column_kwargs={"server_default": func.now()})
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()}
+    )
 
     # Scraping configuration
     selectors: Dict[str, str] = Field(
-        default={}, sa_column=Column(JSON), description="CSS selectors for data extraction"
+        default_factory=dict, sa_column=Column(JSONVariant), description="CSS selectors for data extraction"
+    )
+    headers: Dict[str, str] = Field(
+        default_factory=dict, sa_column=Column(JSONVariant), description="Custom HTTP headers"
     )
-    headers: Dict[str, str] = Field(default={}, sa_column=Column(JSON), description="Custom HTTP headers")
     anti_scraping_config: Dict[str, Any] = Field(
-        default={}, sa_column=Column(JSON), description="Config for handling anti-scraping"
+        default_factory=dict, sa_column=Column(JSONVariant), description="Config for handling anti-scraping"
     )
 
     # Relationships
@@ -57,16 +164,22 @@ class ScrapeSession(SQLModel, table=True):
     """Records each scraping attempt and its results"""
 
     __tablename__ = "scrape_sessions"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_scrape_sessions_website_id_started_at", "website_id", text("started_at DESC")),
+        Index("ix_scrape_sessions_started_at", text("started_at DESC")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     website_id: int = Field(foreign_key="lottery_websites.id")
-    status: ScrapeStatus = Field(default=ScrapeStatus.PENDING)
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    status: ScrapeStatus = Field(default=ScrapeStatus.PENDING, sa_column=Column(EnumInt(ScrapeStatus)))
+    started_at: Optional[datetime] = Field(default=None, sa_column_kwargs={"server_default": func.now()})
     completed_at: Optional[datetime] = Field(default=None)
-    duration_seconds: Optional[Decimal] = Field(default=None, decimal_places=3)
+    duration_seconds: Optional[Decimal] = Field(default=None, sa_column=Column(FastDecimal(12, 3)))
 
     # Anti-scraping details
-    anti_scraping_detected: AntiScrapingMeasure = Field(default=AntiScrapingMeasure.NONE)
+    anti_scraping_detected: AntiScrapingMeasure = Field(
+        default=AntiScrapingMeasure.NONE, sa_column=Column(EnumInt(AntiScrapingMeasure))
+    )
     bypass_method_used: Optional[str] = Field(default=None, max_length=100)
     user_agent: Optional[str] = Field(default=None, max_length=500)
     ip_address: Optional[str] = Field(default=None, max_length=45)
@@ -76,7 +189,7 @@ class ScrapeSession(SQLModel, table=True):
     draws_new: int = Field(default=0, description="Number of new draws added")
     error_message: Optional[str] = Field(default=None, max_length=1000)
     response_status_code: Optional[int] = Field(default=None)
-    response_headers: Dict[str, str] = Field(default={}, sa_column=Column(JSON))
+    response_headers: Dict[str, str] = Field(default_factory=dict, sa_column=Column(JSONVariant))
 
     # Relationships
     website: LotteryWebsite = Relationship(back_populates="scrape_sessions")
@@ -86,6 +199,11 @@ class LotteryDraw(SQLModel, table=True):
     """Stores individual lottery draw results"""
 
     __tablename__ = "lottery_draws"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_lottery_draws_website_id_draw_date", "website_id", text("draw_date DESC")),
+        Index("ix_lottery_draws_draw_date", text("draw_date DESC")),
+        Index("ix_lottery_draws_special_numbers_gin", "special_numbers", postgresql_using="gin"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     website_id: int = Field(foreign_key="lottery_websites.id")
@@ -96,31 +214,59 @@ class LotteryDraw(SQLModel, table=True):
     game_name: Optional[str] = Field(default=None, max_length=100, description="Name of the specific game")
 
     # Winning numbers
-    winning_numbers: List[int] = Field(sa_column=Column(JSON), description="Main winning numbers")
-    bonus_numbers: List[int] = Field(default=[], sa_column=Column(JSON), description="Bonus/supplementary numbers")
+    winning_numbers: List[int] = Field(sa_column=Column(ARRAY(Integer)), description="Main winning numbers")
+    bonus_numbers: List[int] = Field(
+        default_factory=list, sa_column=Column(ARRAY(Integer)), description="Bonus/supplementary numbers"
+    )
     special_numbers: Dict[str, Any] = Field(
-        default={}, sa_column=Column(JSON), description="Other special numbers or info"
+        default_factory=dict, sa_column=Column(JSONVariant), description="Other special numbers or info"
     )
 
     # Additional lottery information
-    jackpot_amount: Optional[Decimal] = Field(default=None, decimal_places=2, description="Jackpot prize amount")
+    jackpot_amount: Optional[Decimal] = Field(
+        default=None, sa_column=Column(FastDecimal(12, 2)), description="Jackpot prize amount"
+    )
     currency: Optional[str] = Field(default=None, max_length=3, description="Currency code (USD, HKD, AUD, etc.)")
     winners_count: Optional[int] = Field(default=None, description="Number of jackpot winners")
     next_draw_date: Optional[datetime] = Field(default=None, description="Date of next draw")
 
     # Prize breakdown
     prize_breakdown: List[Dict[str, Any]] = Field(
-        default=[], sa_column=Column(JSON), description="Prize tiers and amounts"
+        default_factory=list, sa_column=Column(JSONVariant), description="Prize tiers and amounts"
     )
 
     # Metadata
-    raw_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON), description="Raw scraped data for debugging")
-    scraped_at: datetime = Field(default_factory=datetime.utcnow, description="When this draw was scraped")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    scraped_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"server_default": func.now()}, description="When this draw was scraped"
+    )
+    created_at: Optional[datetime] = Field(default=None, sa_column_kwargs={"server_default": func.now()})
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()}
+    )
 
     # Relationships
     website: LotteryWebsite = Relationship(back_populates="lottery_draws")
+    raw: Optional["LotteryDrawRawData"] = Relationship(back_populates="draw")
+
+
+class LotteryDrawRawData(SQLModel, table=True):
+    """Raw scraped payloads, split out so the hot lottery_draws table stays narrow.
+
+    raw_data is debug-only and can be large; keeping it off lottery_draws
+    means list scans and the draw indexes never touch it.
+    """
+
+    __tablename__ = "lottery_draw_raw_data"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_lottery_draw_raw_data_raw_data_gin", "raw_data", postgresql_using="gin"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    draw_id: int = Field(foreign_key="lottery_draws.id", unique=True)
+    raw_data: Dict[str, Any] = Field(
+        default_factory=dict, sa_column=Column(JSONVariant), description="Raw scraped data for debugging"
+    )
+
+    # Relationships
+    draw: LotteryDraw = Relationship(back_populates="raw")
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
@@ -130,9 +276,9 @@ class LotteryWebsiteCreate(SQLModel, table=False):
     country: str = Field(max_length=50)
     is_active: bool = Field(default=True)
     scrape_interval_minutes: int = Field(default=60, ge=1, le=1440)  # 1 minute to 24 hours
-    selectors: Dict[str, str] = Field(default={})
-    headers: Dict[str, str] = Field(default={})
-    anti_scraping_config: Dict[str, Any] = Field(default={})
+    selectors: Dict[str, str] = Field(default_factory=dict)
+    headers: Dict[str, str] = Field(default_factory=dict)
+    anti_scraping_config: Dict[str, Any] = Field(default_factory=dict)
 
 
 class LotteryWebsiteUpdate(SQLModel, table=False):
@@ -171,14 +317,14 @@ class LotteryDrawCreate(SQLModel, table=False):
     draw_number: Optional[str] = Field(default=None, max_length=50)
     game_name: Optional[str] = Field(default=None, max_length=100)
     winning_numbers: List[int]
-    bonus_numbers: List[int] = Field(default=[])
-    special_numbers: Dict[str, Any] = Field(default={})
+    bonus_numbers: List[int] = Field(default_factory=list)
+    special_numbers: Dict[str, Any] = Field(default_factory=dict)
     jackpot_amount: Optional[Decimal] = Field(default=None, decimal_places=2)
     currency: Optional[str] = Field(default=None, max_length=3)
     winners_count: Optional[int] = Field(default=None, ge=0)
     next_draw_date: Optional[datetime] = Field(default=None)
-    prize_breakdown: List[Dict[str, Any]] = Field(default=[])
-    raw_data: Dict[str, Any] = Field(default={})
+    prize_breakdown: List[Dict[str, Any]] = Field(default_factory=list)
+    raw_data: Dict[str, Any] = Field(default_factory=dict)
 
 
 class LotteryDrawUpdate(SQLModel, table=False):
@@ -192,11 +338,16 @@ class LotteryDrawUpdate(SQLModel, table=False):
     winners_count: Optional[int] = Field(default=None, ge=0)
     next_draw_date: Optional[datetime] = Field(default=None)
     prize_breakdown: Optional[List[Dict[str, Any]]] = Field(default=None)
-    raw_data: Optional[Dict[str, Any]] = Field(default=None)
+    # raw_data lives on LotteryDrawRawData; update it through that row, not here
 
 
-# Response schemas for API
-class LotteryDrawResponse(SQLModel, table=False):
+# Response schemas for API. These are plain slotted dataclasses instead of
+# SQLModel classes: the response path needs no validation, and orjson encodes
+# dataclasses natively, so each row costs one slot allocation instead of a
+# pass through pydantic validators. Build them from Core Row tuples via
+# from_row(); the select must list columns in field order.
+@dataclass(slots=True)
+class LotteryDrawResponse:
     id: int
     website_id: int
     website_name: str
@@ -206,7 +357,7 @@ class LotteryDrawResponse(SQLModel, table=False):
     winning_numbers: List[int]
     bonus_numbers: List[int]
     special_numbers: Dict[str, Any]
-    jackpot_amount: Optional[Decimal]
+    jackpot_amount: Optional[float]
     currency: Optional[str]
     winners_count: Optional[int]
     next_draw_date: Optional[str]  # ISO format string
@@ -214,15 +365,24 @@ class LotteryDrawResponse(SQLModel, table=False):
     scraped_at: str  # ISO format string
     created_at: str  # ISO format string
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "LotteryDrawResponse":
+        response = cls(*row)
+        response.website_name = sys.intern(response.website_name)
+        response.game_name = _intern(response.game_name)
+        response.currency = _intern(response.currency)
+        return response
+
 
-class ScrapeSessionResponse(SQLModel, table=False):
+@dataclass(slots=True)
+class ScrapeSessionResponse:
     id: int
     website_id: int
     website_name: str
     status: ScrapeStatus
     started_at: str  # ISO format string
     completed_at: Optional[str]  # ISO format string
-    duration_seconds: Optional[Decimal]
+    duration_seconds: Optional[float]
     anti_scraping_detected: AntiScrapingMeasure
     bypass_method_used: Optional[str]
     draws_found: int
@@ -230,8 +390,16 @@ class ScrapeSessionResponse(SQLModel, table=False):
     error_message: Optional[str]
     response_status_code: Optional[int]
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ScrapeSessionResponse":
+        response = cls(*row)
+        response.website_name = sys.intern(response.website_name)
+        response.bypass_method_used = _intern(response.bypass_method_used)
+        return response
 
-class LotteryWebsiteResponse(SQLModel, table=False):
+
+@dataclass(slots=True)
+class LotteryWebsiteResponse:
     id: int
     name: str
     url: str
@@ -241,5 +409,9 @@ class LotteryWebsiteResponse(SQLModel, table=False):
     last_scraped_at: Optional[str]  # ISO format string
     created_at: str  # ISO format string
     updated_at: str  # ISO format string
-    recent_draws_count: Optional[int] = Field(default=None)
-    last_scrape_status: Optional[ScrapeStatus] = Field(default=None)
+    recent_draws_count: Optional[int] = None
+    last_scrape_status: Optional[ScrapeStatus] = None
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "LotteryWebsiteResponse":
+        return cls(*row)
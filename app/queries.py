@@ -0,0 +1,268 @@
+"""Read-side query helpers for the list endpoints.
+
+The list payloads are assembled inside PostgreSQL via row_to_json/json_agg,
+so Python never materializes per-row DTOs: each query returns a single text
+column holding the finished JSON array, which can be forwarded verbatim as
+the response body (media_type="application/json"). The *Response dataclasses
+in app.models stay around as the schema documentation for these payloads.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import func, insert, text
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, select
+
+from app.models import (
+    ANTI_SCRAPING_CODES,
+    SCRAPE_STATUS_CODES,
+    LotteryDraw,
+    LotteryDrawCreate,
+    LotteryDrawRawData,
+    LotteryWebsite,
+    ScrapeSession,
+)
+
+
+def _enum_case(column_sql: str, codes: dict) -> str:
+    """CASE expression translating an EnumInt code column back to its label."""
+    whens = " ".join(f"WHEN {code} THEN '{member.value}'" for member, code in codes.items())
+    return f"CASE {column_sql} {whens} END"
+
+
+_WEBSITE_CACHE_SIZE = 128
+_website_cache: "OrderedDict[int, LotteryWebsite]" = OrderedDict()
+_website_cache_lock = Lock()
+
+
+def get_website(session: Session, website_id: int) -> Optional[LotteryWebsite]:
+    """Fetch a LotteryWebsite by id through a small process-local LRU.
+
+    Website rows are read-mostly but looked up for every draw/session being
+    processed; the cache skips the round trip for repeat ids. What is cached
+    (and returned) is a detached snapshot copy, never the session's own
+    instance: the live instance expires when the caller's session commits or
+    closes, and a later cache hit would raise DetachedInstanceError. Treat
+    the result as read-only; to modify a website, load it via session.get()
+    and call invalidate_website() after committing.
+    """
+    with _website_cache_lock:
+        snapshot = _website_cache.get(website_id)
+        if snapshot is not None:
+            _website_cache.move_to_end(website_id)
+            return snapshot
+    website = session.get(LotteryWebsite, website_id)
+    if website is None:
+        return None
+    snapshot = LotteryWebsite(**website.model_dump())
+    with _website_cache_lock:
+        _website_cache[website_id] = snapshot
+        while len(_website_cache) > _WEBSITE_CACHE_SIZE:
+            _website_cache.popitem(last=False)
+    return snapshot
+
+
+def invalidate_website(website_id: Optional[int] = None) -> None:
+    """Drop one website (or all websites, if no id is given) from the LRU."""
+    with _website_cache_lock:
+        if website_id is None:
+            _website_cache.clear()
+        else:
+            _website_cache.pop(website_id, None)
+
+
+# to_char pattern producing the same ISO-8601 shape the responses used before
+_ISO_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS'
+
+
+def iso_char(column: Any) -> Any:
+    """Core expression rendering a timestamp column as an ISO-8601 string in SQL.
+
+    Formatting datetimes database-side keeps per-row strftime/isoformat work
+    out of Python when response objects are built from Row tuples.
+    """
+    return func.to_char(column, _ISO_FORMAT)
+
+
+# Column lists in LotteryDrawResponse/ScrapeSessionResponse field order, for
+# Core selects whose rows feed the positional from_row() constructors.
+DRAW_RESPONSE_COLUMNS = (
+    LotteryDraw.id,
+    LotteryDraw.website_id,
+    col(LotteryWebsite.name).label("website_name"),
+    iso_char(LotteryDraw.draw_date).label("draw_date"),
+    LotteryDraw.draw_number,
+    LotteryDraw.game_name,
+    LotteryDraw.winning_numbers,
+    LotteryDraw.bonus_numbers,
+    LotteryDraw.special_numbers,
+    LotteryDraw.jackpot_amount,
+    LotteryDraw.currency,
+    LotteryDraw.winners_count,
+    iso_char(LotteryDraw.next_draw_date).label("next_draw_date"),
+    LotteryDraw.prize_breakdown,
+    iso_char(LotteryDraw.scraped_at).label("scraped_at"),
+    iso_char(LotteryDraw.created_at).label("created_at"),
+)
+
+SESSION_RESPONSE_COLUMNS = (
+    ScrapeSession.id,
+    ScrapeSession.website_id,
+    col(LotteryWebsite.name).label("website_name"),
+    ScrapeSession.status,
+    iso_char(ScrapeSession.started_at).label("started_at"),
+    iso_char(ScrapeSession.completed_at).label("completed_at"),
+    ScrapeSession.duration_seconds,
+    ScrapeSession.anti_scraping_detected,
+    ScrapeSession.bypass_method_used,
+    ScrapeSession.draws_found,
+    ScrapeSession.draws_new,
+    ScrapeSession.error_message,
+    ScrapeSession.response_status_code,
+)
+
+_DRAWS_JSON_SQL = text(f"""
+    SELECT coalesce(json_agg(row_to_json(q)), '[]')::text
+    FROM (
+        SELECT d.id,
+               d.website_id,
+               w.name AS website_name,
+               to_char(d.draw_date, '{_ISO_FORMAT}') AS draw_date,
+               d.draw_number,
+               d.game_name,
+               d.winning_numbers,
+               d.bonus_numbers,
+               d.special_numbers,
+               d.jackpot_amount,
+               d.currency,
+               d.winners_count,
+               to_char(d.next_draw_date, '{_ISO_FORMAT}') AS next_draw_date,
+               d.prize_breakdown,
+               to_char(d.scraped_at, '{_ISO_FORMAT}') AS scraped_at,
+               to_char(d.created_at, '{_ISO_FORMAT}') AS created_at
+        FROM lottery_draws d
+        JOIN lottery_websites w ON w.id = d.website_id
+        WHERE cast(:website_id AS integer) IS NULL OR d.website_id = :website_id
+        ORDER BY d.draw_date DESC
+        LIMIT :limit
+    ) q
+""")
+
+_SESSIONS_JSON_SQL = text(f"""
+    SELECT coalesce(json_agg(row_to_json(q)), '[]')::text
+    FROM (
+        SELECT s.id,
+               s.website_id,
+               w.name AS website_name,
+               {_enum_case("s.status", SCRAPE_STATUS_CODES)} AS status,
+               to_char(s.started_at, '{_ISO_FORMAT}') AS started_at,
+               to_char(s.completed_at, '{_ISO_FORMAT}') AS completed_at,
+               s.duration_seconds,
+               {_enum_case("s.anti_scraping_detected", ANTI_SCRAPING_CODES)} AS anti_scraping_detected,
+               s.bypass_method_used,
+               s.draws_found,
+               s.draws_new,
+               s.error_message,
+               s.response_status_code
+        FROM scrape_sessions s
+        JOIN lottery_websites w ON w.id = s.website_id
+        WHERE cast(:website_id AS integer) IS NULL OR s.website_id = :website_id
+        ORDER BY s.started_at DESC
+        LIMIT :limit
+    ) q
+""")
+
+
+_WEBSITES_JSON_SQL = text(f"""
+    SELECT coalesce(json_agg(row_to_json(q)), '[]')::text
+    FROM (
+        SELECT w.id,
+               w.name,
+               w.url,
+               w.country,
+               w.is_active,
+               w.scrape_interval_minutes,
+               to_char(w.last_scraped_at, '{_ISO_FORMAT}') AS last_scraped_at,
+               to_char(w.created_at, '{_ISO_FORMAT}') AS created_at,
+               to_char(w.updated_at, '{_ISO_FORMAT}') AS updated_at,
+               st.recent_draws_count,
+               {_enum_case("st.last_scrape_status", SCRAPE_STATUS_CODES)} AS last_scrape_status
+        FROM lottery_websites w
+        LEFT JOIN mv_website_stats st ON st.website_id = w.id
+        ORDER BY w.name
+    ) q
+""")
+
+
+def websites_json(session: Session) -> str:
+    """Return the website list payload as a JSON array string built by Postgres.
+
+    Per-website aggregates come from mv_website_stats (see app.database), so
+    listing does no counting; refresh_website_stats() keeps them current.
+    """
+    return session.execute(_WEBSITES_JSON_SQL).scalar_one()
+
+
+def bulk_insert_draws(session: Session, draws: Sequence[LotteryDrawCreate]) -> List[int]:
+    """Insert many draws with one multi-VALUES statement, returning their ids.
+
+    Skips the per-object ORM unit of work (identity map, attribute events,
+    per-row INSERT) in favor of a single Core insert ... RETURNING id.
+    Non-empty raw_data payloads go to the lottery_draw_raw_data side table.
+    The caller owns the session and is responsible for committing.
+    """
+    if not draws:
+        return []
+    rows = [draw.model_dump() for draw in draws]
+    payloads = [row.pop("raw_data") for row in rows]
+    result = session.execute(insert(LotteryDraw).values(rows).returning(LotteryDraw.id))  # type: ignore[arg-type]
+    draw_ids = [row[0] for row in result]
+    raw_rows = [{"draw_id": draw_id, "raw_data": payload} for draw_id, payload in zip(draw_ids, payloads) if payload]
+    if raw_rows:
+        session.execute(insert(LotteryDrawRawData).values(raw_rows))  # type: ignore[arg-type]
+    return draw_ids
+
+
+def list_draws(session: Session, website_id: Optional[int] = None, limit: int = 100) -> List[LotteryDraw]:
+    """ORM draw listing with the website relationship loaded eagerly.
+
+    selectinload fetches all referenced websites in one extra SELECT instead
+    of one lazy load per row (the classic N+1) when callers need full ORM
+    objects rather than the JSON payloads above.
+    """
+    stmt = (
+        select(LotteryDraw)
+        .options(selectinload(LotteryDraw.website))  # type: ignore[arg-type]
+        .order_by(col(LotteryDraw.draw_date).desc())
+        .limit(limit)
+    )
+    if website_id is not None:
+        stmt = stmt.where(LotteryDraw.website_id == website_id)
+    return list(session.exec(stmt).all())
+
+
+def list_sessions(session: Session, website_id: Optional[int] = None, limit: int = 100) -> List[ScrapeSession]:
+    """ORM scrape-session listing with the website relationship loaded eagerly."""
+    stmt = (
+        select(ScrapeSession)
+        .options(selectinload(ScrapeSession.website))  # type: ignore[arg-type]
+        .order_by(col(ScrapeSession.started_at).desc())
+        .limit(limit)
+    )
+    if website_id is not None:
+        stmt = stmt.where(ScrapeSession.website_id == website_id)
+    return list(session.exec(stmt).all())
+
+
+def draws_json(session: Session, website_id: Optional[int] = None, limit: int = 100) -> str:
+    """Return the draw list payload as a JSON array string built by Postgres."""
+    result = session.execute(_DRAWS_JSON_SQL, {"website_id": website_id, "limit": limit})
+    return result.scalar_one()
+
+
+def sessions_json(session: Session, website_id: Optional[int] = None, limit: int = 100) -> str:
+    """Return the scrape-session list payload as a JSON array string built by Postgres."""
+    result = session.execute(_SESSIONS_JSON_SQL, {"website_id": website_id, "limit": limit})
+    return result.scalar_one()
@@ -0,0 +1,204 @@
+"""Tests for the query helpers and the custom column types behind them.
+
+The first half is DB-free: codec fallback, EnumInt/FastDecimal behavior, the
+positional from_row() contract, and the raw_data split in bulk_insert_draws.
+The sqlmodel-marked smoke at the end exercises the SQL payload helpers and
+mv_website_stats against a real database (deselected by default, like
+tests/test_models_smoke.py).
+"""
+
+import dataclasses
+import importlib
+import json
+import sys
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Sequence, cast
+
+import pytest
+from sqlalchemy import ColumnElement
+from sqlmodel import select
+
+import app.codec
+from app.models import (
+    ANTI_SCRAPING_CODES,
+    SCRAPE_STATUS_CODES,
+    AntiScrapingMeasure,
+    EnumInt,
+    FastDecimal,
+    LotteryDrawCreate,
+    LotteryDrawRawData,
+    LotteryDrawResponse,
+    LotteryWebsite,
+    LotteryWebsiteResponse,
+    ScrapeSession,
+    ScrapeSessionResponse,
+    ScrapeStatus,
+)
+from app.queries import (
+    DRAW_RESPONSE_COLUMNS,
+    SESSION_RESPONSE_COLUMNS,
+    bulk_insert_draws,
+    draws_json,
+    sessions_json,
+    websites_json,
+)
+
+
+def test_codec_roundtrip():
+    payload = {"numbers": [1, 2, 3], "nested": {"a": None}}
+    assert app.codec.json_decode(app.codec.json_encode(payload)) == payload
+    assert app.codec.json_decode(app.codec.json_encode_str(payload)) == payload
+
+
+def test_codec_stdlib_fallback(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    try:
+        codec = importlib.reload(app.codec)
+        assert codec.json_decode(codec.json_encode_str({"a": [1, 2]})) == {"a": [1, 2]}
+        response = LotteryWebsiteResponse.from_row((1, "n", "u", "c", True, 60, None, "t", "t"))
+        assert json.loads(codec.json_encode([response]))[0]["name"] == "n"
+    finally:
+        monkeypatch.undo()
+        importlib.reload(app.codec)
+
+
+def test_enumint_roundtrip():
+    for enum_type, codes in ((ScrapeStatus, SCRAPE_STATUS_CODES), (AntiScrapingMeasure, ANTI_SCRAPING_CODES)):
+        column_type = EnumInt(enum_type)
+        for member, code in codes.items():
+            assert column_type.process_bind_param(member, None) == code
+            assert column_type.process_bind_param(member.value, None) == code
+            assert column_type.process_result_value(code, None) is member
+        assert column_type.process_bind_param(None, None) is None
+        assert column_type.process_result_value(None, None) is None
+
+
+def test_enumint_cache_keys_differ_per_enum():
+    assert EnumInt(ScrapeStatus)._static_cache_key != EnumInt(AntiScrapingMeasure)._static_cache_key
+
+
+def test_fastdecimal_loads_float_and_keys_on_precision():
+    column_type = FastDecimal(12, 2)
+    assert column_type.process_result_value(Decimal("3.50"), None) == 3.5
+    assert column_type.process_result_value(None, None) is None
+    assert FastDecimal(12, 2)._static_cache_key != FastDecimal(12, 3)._static_cache_key
+
+
+def test_response_columns_match_dataclass_field_order():
+    draw_columns = cast("Sequence[ColumnElement[Any]]", DRAW_RESPONSE_COLUMNS)
+    draw_fields = [field.name for field in dataclasses.fields(LotteryDrawResponse)]
+    assert [column.key for column in draw_columns] == draw_fields
+    session_columns = cast("Sequence[ColumnElement[Any]]", SESSION_RESPONSE_COLUMNS)
+    session_fields = [field.name for field in dataclasses.fields(ScrapeSessionResponse)]
+    assert [column.key for column in session_columns] == session_fields
+
+
+def test_from_row_interns_repeated_strings():
+    def row():
+        # built at runtime so the strings are not compile-time interned
+        return (
+            1,
+            1,
+            "".join(["Mark", " Six"]),
+            "2026-01-01T00:00:00",
+            None,
+            "".join(["Lo", "tto"]),
+            [1, 2],
+            [],
+            {},
+            None,
+            "".join(["HK", "D"]),
+            None,
+            None,
+            [],
+            "t",
+            "t",
+        )
+
+    first = LotteryDrawResponse.from_row(row())
+    second = LotteryDrawResponse.from_row(row())
+    assert first.website_name is second.website_name
+    assert first.game_name is second.game_name
+    assert first.currency is second.currency
+
+
+class _RecordingSession:
+    """Stands in for a Session in DB-free tests; captures executed statements."""
+
+    def __init__(self, draw_ids):
+        self._draw_ids = draw_ids
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        if len(self.statements) == 1:
+            return [(draw_id,) for draw_id in self._draw_ids]
+        return []
+
+
+def test_bulk_insert_draws_pairs_raw_data_with_returned_ids():
+    draws = [
+        LotteryDrawCreate(
+            website_id=1, draw_date=datetime(2026, 1, 1), winning_numbers=[1, 2], raw_data={"html": "<p/>"}
+        ),
+        LotteryDrawCreate(website_id=1, draw_date=datetime(2026, 1, 8), winning_numbers=[3]),
+    ]
+    session = _RecordingSession([11, 12])
+    assert bulk_insert_draws(session, draws) == [11, 12]  # type: ignore[arg-type]
+    assert len(session.statements) == 2
+    raw_rows = [{column.key: value for column, value in row.items()} for row in session.statements[1]._multi_values[0]]
+    assert raw_rows == [{"draw_id": 11, "raw_data": {"html": "<p/>"}}]
+
+
+def test_bulk_insert_draws_empty_is_a_no_op():
+    session = _RecordingSession([])
+    assert bulk_insert_draws(session, []) == []  # type: ignore[arg-type]
+    assert session.statements == []
+
+
+@pytest.mark.sqlmodel
+def test_query_helpers_smoke():
+    """End-to-end check of the JSON payload helpers and mv_website_stats."""
+    from app.database import get_session, refresh_website_stats, reset_db
+
+    reset_db()
+    with get_session() as session:
+        website = LotteryWebsite(name="Smoke Lotto", url="https://smoke.example/lotto", country="Testland")
+        session.add(website)
+        session.commit()
+        session.refresh(website)
+        assert website.id is not None
+
+        draw_ids = bulk_insert_draws(
+            session,
+            [
+                LotteryDrawCreate(
+                    website_id=website.id,
+                    draw_date=datetime(2026, 1, 1),
+                    winning_numbers=[1, 2, 3],
+                    raw_data={"source": "smoke"},
+                ),
+                LotteryDrawCreate(website_id=website.id, draw_date=datetime(2026, 1, 8), winning_numbers=[4, 5, 6]),
+            ],
+        )
+        session.add(ScrapeSession(website_id=website.id, status=ScrapeStatus.SUCCESS))
+        session.commit()
+        assert len(draw_ids) == 2
+
+        draws = json.loads(draws_json(session, website_id=website.id))
+        assert len(draws) == 2
+        assert draws[0]["website_name"] == "Smoke Lotto"
+        assert draws[0]["draw_date"] == "2026-01-08T00:00:00"
+
+        sessions = json.loads(sessions_json(session, website_id=website.id))
+        assert sessions[0]["status"] == "success"
+        assert sessions[0]["anti_scraping_detected"] == "none"
+
+        raw_rows = list(session.exec(select(LotteryDrawRawData)).all())
+        assert [row.draw_id for row in raw_rows] == [draw_ids[0]]
+
+        refresh_website_stats()
+        websites = json.loads(websites_json(session))
+        assert websites[0]["recent_draws_count"] == 2
+        assert websites[0]["last_scrape_status"] == "success"